@@ -0,0 +1 @@
+"""Shared building blocks for the campaign simulation scripts."""
@@ -0,0 +1,191 @@
+"""
+campaign_sim.core
+-----------------
+
+Scenario table and metric kernel shared by ``simulate.py`` and
+``simulation.py``.
+
+Scenarios are stored as a NumPy structured array (one field per parameter)
+and the metrics are returned as a dict of column arrays, so every metric is
+computed once for all scenarios instead of once per scenario.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+SCENARIO_DTYPE = np.dtype(
+    [
+        ("name", "U16"),
+        ("budget", np.float64),
+        ("days", np.int64),
+        ("cpv", np.float64),
+        ("ctr", np.float64),
+        ("conv", np.float64),
+    ]
+)
+
+METRIC_NAMES = ("views", "clicks", "conversions", "revenue", "profit", "roi")
+
+# One row of results; the field names double as the CSV column names.
+ScenarioResult = namedtuple(
+    "ScenarioResult", "Scenario Budget Days Views Clicks Conversions Revenue Profit ROI"
+)
+
+
+def make_scenarios(cpv_small: float = 0.06, cpv_large: float = 0.05,
+                   ctr_small: float = 0.05, ctr_large: float = 0.06,
+                   conv_small: float = 0.04, conv_large: float = 0.05) -> np.ndarray:
+    """Build the table of predefined scenarios.
+
+    Small and baseline scenarios use the ``*_small`` rates; large and long
+    scenarios use the ``*_large`` rates.
+
+    Returns:
+        A structured array with fields ``name``, ``budget``, ``days``, ``cpv``,
+        ``ctr`` and ``conv``.
+    """
+    return np.array(
+        [
+            ("Small", 100, 5, cpv_small, ctr_small, conv_small),
+            ("Baseline", 200, 10, cpv_small, ctr_small, conv_small),
+            ("Large", 500, 30, cpv_large, ctr_large, conv_large),
+            ("Long", 400, 60, cpv_large, ctr_large, conv_large),
+        ],
+        dtype=SCENARIO_DTYPE,
+    )
+
+
+SCENARIOS = make_scenarios()
+
+
+def _empty(out_count, *operands):
+    """Allocate float64 buffers of the operands' broadcast shape."""
+    shape = np.broadcast_shapes(*(np.shape(operand) for operand in operands))
+    return tuple(np.empty(shape, dtype=np.float64) for _ in range(out_count))
+
+
+def multipliers(cpv, ctr, conv, revenue_per_sale, profit_per_sale, out=None):
+    """Collapse the per-view/per-click rates into per-dollar multipliers.
+
+    Revenue and profit are linear in budget, so for fixed CPV, CTR and
+    conversion rate they reduce to ``budget * k_rev`` and ``budget * k_prof``.
+
+    Args:
+        out: Optional tuple of two preallocated float64 arrays
+            ``(k_rev, k_prof)`` to write into. They must not share memory
+            with ``cpv``, ``ctr`` or ``conv``.
+
+    Returns:
+        A tuple ``(k_rev, k_prof)`` of revenue and profit per dollar of budget.
+    """
+    if out is None:
+        out = _empty(2, cpv, ctr, conv)
+    k_rev, k_prof = out
+    # conversions per dollar is staged in k_prof before being scaled
+    np.multiply(ctr, conv, out=k_prof)
+    np.divide(k_prof, cpv, out=k_prof)
+    np.multiply(k_prof, revenue_per_sale, out=k_rev)
+    np.multiply(k_prof, profit_per_sale, out=k_prof)
+    return out
+
+
+def project(budget, k_rev, k_prof, out=None):
+    """Project revenue, profit and ROI for budgets using precomputed multipliers.
+
+    This is the fast path for sweeping budget while CPV, CTR and conversion
+    rate stay fixed; see multipliers().
+
+    Args:
+        out: Optional tuple of three preallocated float64 arrays
+            ``(revenue, profit, roi)`` to write into. They must not share
+            memory with ``budget``; ``k_prof`` may be the profit buffer and
+            ``k_rev`` the roi buffer.
+
+    Returns:
+        A tuple of arrays ``(revenue, profit, roi)``.
+    """
+    budget = np.asarray(budget, dtype=np.float64)
+    if out is None:
+        out = _empty(3, budget, k_rev, k_prof)
+    revenue, profit, roi = out
+    np.multiply(budget, k_rev, out=revenue)
+    np.multiply(budget, k_prof, out=profit)
+    np.copyto(roi, k_rev)
+    np.copyto(roi, 0.0, where=np.equal(budget, 0))
+    return out
+
+
+def compute_metrics(budget, cpv, ctr, conv, revenue_per_sale, profit_per_sale, out=None):
+    """Compute the metric columns for arrays of scenario parameters.
+
+    All array arguments must broadcast against each other; the per-sale
+    values may be scalars.
+
+    Args:
+        out: Optional tuple of six preallocated float64 arrays
+            ``(views, clicks, conversions, revenue, profit, roi)`` of the
+            broadcast shape. They are written in place, so repeated calls
+            (e.g. Monte Carlo trials) can reuse the same buffers. Because
+            the inputs are re-read after the first outputs are written, the
+            buffers must not share memory with ``budget``, ``cpv``, ``ctr``
+            or ``conv``, nor with each other. This is not checked here; the
+            public entry points in ``simulate`` validate their buffers.
+
+    Returns:
+        A tuple of arrays ``(views, clicks, conversions, revenue, profit, roi)``;
+        ``out`` itself when it is given.
+    """
+    if out is None:
+        out = _empty(len(METRIC_NAMES), budget, cpv, ctr, conv)
+    views, clicks, conversions, revenue, profit, roi = out
+    # views are total budget divided by cost per view
+    np.divide(budget, cpv, out=views)
+    # clicks come from applying click‑through rate to views
+    np.multiply(views, ctr, out=clicks)
+    # conversions come from applying conversion rate to clicks
+    np.multiply(clicks, conv, out=conversions)
+    # revenue, profit and ROI only depend on budget through the per-dollar
+    # multipliers, which are staged in the roi and profit buffers so no
+    # temporaries are allocated.
+    multipliers(cpv, ctr, conv, revenue_per_sale, profit_per_sale, out=(roi, profit))
+    project(budget, roi, profit, out=(revenue, profit, roi))
+    return out
+
+
+def compute(scenarios: np.ndarray = SCENARIOS,
+            revenue_per_sale: float = 100.0,
+            profit_per_sale: float = 50.0) -> dict:
+    """Compute simulation metrics for every row of a scenario table.
+
+    Args:
+        scenarios: Structured array as returned by make_scenarios().
+        revenue_per_sale: Gross revenue per conversion.
+        profit_per_sale: Profit per conversion (after costs).
+
+    Returns:
+        A dict mapping each name in ``METRIC_NAMES`` to an array with one
+        value per scenario. ROI is revenue divided by budget.
+    """
+    metrics = compute_metrics(
+        scenarios["budget"], scenarios["cpv"], scenarios["ctr"], scenarios["conv"],
+        revenue_per_sale, profit_per_sale,
+    )
+    return dict(zip(METRIC_NAMES, metrics))
+
+
+def to_rows(scenarios: np.ndarray, metrics: dict) -> tuple:
+    """Combine a scenario table and its metrics into one row per scenario.
+
+    Returns:
+        A tuple of ScenarioResult tuples. The result is immutable so it can be
+        cached and shared between callers.
+    """
+    return tuple(
+        # whole-dollar budgets are reported as ints; fractional ones are kept
+        ScenarioResult(name, int(budget) if budget.is_integer() else budget, days, *values)
+        for name, budget, days, *values in zip(
+            scenarios["name"].tolist(), scenarios["budget"].tolist(), scenarios["days"].tolist(),
+            *(metrics[key].tolist() for key in METRIC_NAMES),
+        )
+    )
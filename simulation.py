@@ -5,125 +5,91 @@
 large and long) defined in the accompanying presentation. It computes
 key metrics such as views, clicks, conversions, revenue, profit and
 return on investment (ROI) based on assumed CPV, CTR and conversion
-rates for each scenario. The results are written to a CSV file and a
-simple bar chart is saved to disk.
+rates for each scenario, using the shared scenario table and metric
+kernel in ``campaign_sim.core``. The results are written to a CSV file and,
+when run as a script, a simple bar chart is saved to disk.
 
 Usage:
-    python simulation.py
+    python simulation.py [--no-chart]
 
 The output files `simulation_results.csv` and `simulation_chart.png`
-will be created in the working directory. These artefacts can be used
+will be created in the working directory; `--no-chart` skips the chart
+(and the matplotlib import) when only the CSV is needed. These artefacts can be used
 in the slide deck and as part of the GitHub Actions workflow.
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
+
+import numpy as np
+
+from campaign_sim import core
 
 def run_simulation():
-    scenarios = [
-        {
-            "Scenario": "Small",
-            "Budget": 100,
-            "Days": 5,
-            "CPV": 0.06,
-            "CTR": 0.05,
-            "ConvRate": 0.04,
-            "RevenuePerSale": 100,
-            "ProfitPerSale": 50,
-        },
-        {
-            "Scenario": "Baseline",
-            "Budget": 200,
-            "Days": 10,
-            "CPV": 0.06,
-            "CTR": 0.05,
-            "ConvRate": 0.04,
-            "RevenuePerSale": 100,
-            "ProfitPerSale": 50,
-        },
-        {
-            "Scenario": "Large",
-            "Budget": 500,
-            "Days": 30,
-            "CPV": 0.05,
-            "CTR": 0.06,
-            "ConvRate": 0.05,
-            "RevenuePerSale": 100,
-            "ProfitPerSale": 50,
-        },
-        {
-            "Scenario": "Long",
-            "Budget": 400,
-            "Days": 60,
-            "CPV": 0.05,
-            "CTR": 0.06,
-            "ConvRate": 0.05,
-            "RevenuePerSale": 100,
-            "ProfitPerSale": 50,
-        },
-    ]
-
-    rows = []
-    for s in scenarios:
-        budget = s["Budget"]
-        views = budget / s["CPV"]
-        clicks = views * s["CTR"]
-        conversions = clicks * s["ConvRate"]
-        revenue = conversions * s["RevenuePerSale"]
-        profit = conversions * s["ProfitPerSale"]
-        roi = profit / budget
-        rows.append(
-            {
-                "Scenario": s["Scenario"],
-                "Budget": budget,
-                "Days": s["Days"],
-                "Views": views,
-                "Clicks": clicks,
-                "Conversions": conversions,
-                "Revenue": revenue,
-                "Profit": profit,
-                "ROI": roi,
-            }
-        )
-
-    df = pd.DataFrame(rows)
+    metrics = core.compute(core.SCENARIOS, revenue_per_sale=100.0, profit_per_sale=50.0)
+    rows = core.to_rows(core.SCENARIOS, metrics)
+
     # Save to CSV
-    df.to_csv("simulation_results.csv", index=False)
+    with open("simulation_results.csv", mode="w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(core.ScenarioResult._fields)
+        writer.writerows(rows)
+
+    return rows
+
 
-    # Create bar chart of profit and ROI (% multiplied by 100)
-    fig, ax1 = plt.subplots()
-    scenarios = df["Scenario"]
-    profit_vals = df["Profit"]
-    roi_vals = df["ROI"] * 100  # convert to percentage
+def plot_results(rows, path: str = "simulation_chart.png") -> None:
+    """Save a bar chart of profit and ROI for the given result rows.
 
-    bar_width = 0.35
-    x = range(len(scenarios))
+    Args:
+        rows: Sequence of ScenarioResult tuples returned by run_simulation().
+        path: Path of the PNG file to write.
+    """
+    # matplotlib is only imported when a chart is requested. The figure is
+    # rendered on its own Agg canvas rather than through pyplot, so the
+    # caller's backend and open figures are left untouched.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
-    ax1.bar(x, profit_vals, width=bar_width, label="Profit ($)")
+    # Create side-by-side bar charts of profit and ROI (% multiplied by 100)
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    ax1, ax2 = fig.subplots(1, 2)
+    columns = core.ScenarioResult(*zip(*rows))
+    scenarios = columns.Scenario
+    profit_vals = np.asarray(columns.Profit)
+    roi_vals = np.asarray(columns.ROI) * 100  # convert to percentage
+
+    x = np.arange(len(scenarios))
+
+    ax1.bar(x, profit_vals)
     ax1.set_xlabel("Scenario")
     ax1.set_ylabel("Profit ($)")
-    ax1.set_title("Simulation Results: Profit and ROI")
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(scenarios)
+    ax1.set_title("Profit")
+    ax1.set_xticks(x, scenarios)
 
-    ax2 = ax1.twinx()
-    ax2.bar([i + bar_width for i in x], roi_vals, width=bar_width, label="ROI (%)")
+    ax2.bar(x, roi_vals, color="tab:orange")
+    ax2.set_xlabel("Scenario")
     ax2.set_ylabel("ROI (%)")
+    ax2.set_title("ROI")
+    ax2.set_xticks(x, scenarios)
+
+    fig.suptitle("Simulation Results: Profit and ROI")
+    fig.tight_layout()
+    fig.savefig(path)
+
 
-    # Add legend
-    lines, labels = [], []
-    for ax in [ax1, ax2]:
-        line, label = ax.get_legend_handles_labels()
-        lines += line
-        labels += label
-    ax1.legend(lines, labels, loc="upper left")
+def parse_args():
+    import argparse
 
-    plt.tight_layout()
-    plt.savefig("simulation_chart.png")
-    plt.close()
+    parser = argparse.ArgumentParser(description="Run the campaign simulation and chart the results.")
+    parser.add_argument("--no-chart", action="store_true", help="Only write the CSV; skip rendering the chart.")
+    return parser.parse_args()
 
-    return df
 
 if __name__ == "__main__":
+    args = parse_args()
     results = run_simulation()
-    print(results)
\ No newline at end of file
+    if not args.no_chart:
+        plot_results(results)
+    for row in results:
+        print(row)
\ No newline at end of file
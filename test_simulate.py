@@ -0,0 +1,197 @@
+import csv
+
+import numpy as np
+import pytest
+import simulate
+from campaign_sim import core
+
+DEFAULTS = dict(
+    cpv_small=0.06,
+    cpv_large=0.05,
+    ctr_small=0.05,
+    ctr_large=0.06,
+    conv_small=0.04,
+    conv_large=0.05,
+)
+
+
+def _sweep_params(n: int = 5):
+    rng = np.random.default_rng(0)
+    return (
+        rng.uniform(50, 500, n),
+        rng.uniform(0.04, 0.07, n),
+        rng.uniform(0.04, 0.07, n),
+        rng.uniform(0.03, 0.06, n),
+    )
+
+
+# Hand-computed from budget / cpv * ctr * conv with $100 revenue and $50
+# profit per sale; ROI is revenue / budget.
+EXPECTED = {
+    # Scenario: (Budget, Days, Views, Clicks, Conversions, Revenue, Profit, ROI)
+    "Small": (100, 5, 5000 / 3, 250 / 3, 10 / 3, 1000 / 3, 500 / 3, 10 / 3),
+    "Baseline": (200, 10, 10000 / 3, 500 / 3, 20 / 3, 2000 / 3, 1000 / 3, 10 / 3),
+    "Large": (500, 30, 10000.0, 600.0, 30.0, 3000.0, 1500.0, 6.0),
+    "Long": (400, 60, 8000.0, 480.0, 24.0, 2400.0, 1200.0, 6.0),
+}
+
+EXPECTED_CSV = (
+    b"Scenario,Budget,Days,Views,Clicks,Conversions,Revenue,Profit,ROI\r\n"
+    b"Small,100,5,1666.6666666666667,83.33333333333334,3.333333333333334,"
+    b"333.33333333333337,166.66666666666669,3.3333333333333335\r\n"
+    b"Baseline,200,10,3333.3333333333335,166.66666666666669,6.666666666666668,"
+    b"666.6666666666667,333.33333333333337,3.3333333333333335\r\n"
+    b"Large,500,30,10000.0,600.0,30.0,3000.0,1500.0,6.0\r\n"
+    b"Long,400,60,8000.0,480.0,24.0,2400.0,1200.0,6.0\r\n"
+)
+
+
+def test_run_scenarios_default_values() -> None:
+    rows = simulate.run_scenarios(**DEFAULTS)
+
+    assert [row.Scenario for row in rows] == list(EXPECTED)
+    for row in rows:
+        assert tuple(row[1:]) == pytest.approx(EXPECTED[row.Scenario], rel=1e-12)
+
+
+def test_sweep_default_values() -> None:
+    scenarios = core.make_scenarios(**DEFAULTS)
+    data = simulate.run_scenarios_sweep(scenarios["budget"], scenarios["cpv"], scenarios["ctr"], scenarios["conv"])
+
+    expected = np.array([values[2:] for values in EXPECTED.values()])
+    np.testing.assert_allclose(data, expected, rtol=1e-12)
+
+
+def test_save_to_csv_bytes(tmp_path) -> None:
+    path = tmp_path / "results.csv"
+    simulate.save_to_csv(simulate.run_scenarios(**DEFAULTS), str(path))
+
+    assert path.read_bytes() == EXPECTED_CSV
+
+
+def test_sweep_rejects_mismatched_lengths() -> None:
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_sweep([100.0, 200.0], [0.06], [0.05, 0.05], [0.04, 0.04])
+
+
+def test_zero_budget_has_zero_roi() -> None:
+    data = simulate.run_scenarios_sweep([0.0, 100.0], [0.06, 0.06], [0.05, 0.05], [0.04, 0.04])
+    assert data[0, core.METRIC_NAMES.index("roi")] == 0.0
+    assert data[1, core.METRIC_NAMES.index("roi")] > 0.0
+
+
+@pytest.mark.parametrize("cpv_small", [0.0, -0.06])
+def test_run_scenarios_rejects_non_positive_cpv(cpv_small: float) -> None:
+    with pytest.raises(ValueError):
+        simulate.run_scenarios(**{**DEFAULTS, "cpv_small": cpv_small})
+
+
+def test_multipliers_project_match_explicit_chain() -> None:
+    budget, cpv, ctr, conv = _sweep_params()
+    conversions = budget / cpv * ctr * conv
+
+    k_rev, k_prof = core.multipliers(cpv, ctr, conv, 100.0, 50.0)
+    revenue, profit, roi = core.project(budget, k_rev, k_prof)
+
+    np.testing.assert_allclose(revenue, conversions * 100.0, rtol=1e-12)
+    np.testing.assert_allclose(profit, conversions * 50.0, rtol=1e-12)
+    np.testing.assert_allclose(roi, conversions * 100.0 / budget, rtol=1e-12)
+
+
+def test_save_sweep_to_csv(tmp_path) -> None:
+    params = _sweep_params(4)
+    path = tmp_path / "sweep.csv"
+    simulate.save_sweep_to_csv(simulate.run_scenarios_sweep(*params), str(path), *params)
+
+    with open(path, newline="") as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert rows[0] == ["Budget", "CPV", "CTR", "ConvRate", "Views", "Clicks", "Conversions", "Revenue", "Profit", "ROI"]
+    assert len(rows) == 1 + len(params[0])
+    assert float(rows[1][0]) == pytest.approx(params[0][0])
+
+
+def test_save_sweep_to_csv_rejects_mismatched_params(tmp_path) -> None:
+    budget, cpv, ctr, conv = _sweep_params(4)
+    data = simulate.run_scenarios_sweep(budget, cpv, ctr, conv)
+    with pytest.raises(ValueError, match="cpv"):
+        simulate.save_sweep_to_csv(data, str(tmp_path / "sweep.csv"), budget, cpv[:3], ctr, conv)
+
+
+def test_sweep_rejects_bad_out() -> None:
+    params = _sweep_params(3)
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_sweep(*params, out=np.empty((4, 6)))
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_sweep(*params, out=np.empty((3, 6), dtype=np.float32))
+    with pytest.raises(TypeError):
+        simulate.run_scenarios_sweep(*params, out=[[0.0] * 6] * 3)
+
+
+def test_sweep_rejects_out_aliasing_inputs() -> None:
+    params = _sweep_params()
+    out = np.empty((len(params[0]), len(core.METRIC_NAMES)))
+    out[:, 0] = params[0]
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_sweep(out[:, 0], *params[1:], out=out)
+
+
+def test_sweep_reuses_out_buffer() -> None:
+    params = _sweep_params()
+    expected = simulate.run_scenarios_sweep(*params)
+
+    out = np.empty((len(params[0]), len(core.METRIC_NAMES)))
+    for _ in range(2):
+        result = simulate.run_scenarios_sweep(*params, out=out)
+        assert result is out
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_into_matches_sweep() -> None:
+    params = _sweep_params()
+    buffers = [np.empty(len(params[0])) for _ in core.METRIC_NAMES]
+    simulate.run_scenarios_into(*params, 100.0, 50.0, *buffers)
+
+    np.testing.assert_array_equal(np.column_stack(buffers), simulate.run_scenarios_sweep(*params))
+
+
+def test_into_rejects_buffers_aliasing_inputs() -> None:
+    budget, cpv, ctr, conv = _sweep_params()
+    buffers = [np.empty_like(budget) for _ in range(5)]
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_into(budget, cpv, ctr, conv, 100.0, 50.0, budget, *buffers)
+
+
+def test_into_rejects_overlapping_outputs() -> None:
+    params = _sweep_params()
+    shared = np.empty_like(params[0])
+    others = [np.empty_like(shared) for _ in range(4)]
+    with pytest.raises(ValueError):
+        simulate.run_scenarios_into(*params, 100.0, 50.0, shared, shared, *others)
+
+
+def test_to_rows_keeps_fractional_budget() -> None:
+    scenarios = core.make_scenarios()
+    scenarios["budget"][0] = 150.5
+    rows = core.to_rows(scenarios, core.compute(scenarios))
+
+    assert rows[0].Budget == 150.5
+    assert isinstance(rows[0].Budget, float)
+
+
+def test_to_rows_reports_whole_budgets_as_int() -> None:
+    rows = core.to_rows(core.SCENARIOS, core.compute(core.SCENARIOS))
+
+    assert [row.Budget for row in rows] == [100, 200, 500, 400]
+    assert all(type(row.Budget) is int for row in rows)
+
+
+def test_run_scenarios_is_cached_and_immutable() -> None:
+    first = simulate.run_scenarios(**DEFAULTS)
+    assert simulate.run_scenarios(**DEFAULTS) is first
+
+    assert isinstance(first, tuple)
+    for row in first:
+        assert isinstance(row, core.ScenarioResult)
+        assert all(type(value) in (str, int, float) for value in row)
+        with pytest.raises(AttributeError):
+            row.Profit = 0.0
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Runs simulation.py as __main__ and reports whether matplotlib was imported.
+RUN_NO_CHART = f"""
+import runpy, sys
+sys.path.insert(0, {ROOT!r})
+sys.argv = ["simulation.py", "--no-chart"]
+runpy.run_path({os.path.join(ROOT, "simulation.py")!r}, run_name="__main__")
+print("matplotlib loaded:", any(name.split(".")[0] == "matplotlib" for name in sys.modules))
+"""
+
+
+def test_no_chart_writes_only_csv(tmp_path) -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_NO_CHART], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+
+    assert sorted(os.listdir(tmp_path)) == ["simulation_results.csv"]
+    assert "matplotlib loaded: False" in result.stdout